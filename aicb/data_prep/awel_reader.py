@@ -28,16 +28,170 @@ Example usage:
     >>> print(f"Loaded {stats['total_conversations']} conversations")
 """
 
+from collections.abc import Iterator
 from pathlib import Path
 
-from .models import Conversation, Message, Metadata
+from .models import Conversation, ConversationFast, ConversationLike, Message, MessageFast, Metadata, MetadataFast
+from .table import ConversationTable
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 from loguru import logger
 import re
-import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+# Column holding the raw conversation text in the AWEL CSV export
+_CHAT_COLUMN = "gesprek anoniem"
+
+# Bytes of CSV parsed per record batch; bounds the working set of a load
+_CSV_BLOCK_SIZE = 8 << 20
+
+# Conversation header: captures the start date (DD.MM.YYYY) and time (HH:MM)
+_DATE_RE = re.compile(r"Date/time:\s*([\d.]+),\s*(\d{2}:\d{2})")
+
+# Messages: captures HH:MM, sender, and message (continuation lines included)
+_MSG_RE = re.compile(r"(\d{2}:\d{2})\s+([^:]+):\s+([^\n]+(?:\n(?!\d{2}:\d{2}).*)*)")
+
+# Sender names used by the AWEL operators; every other sender is a user
+_OPERATOR_ROLES = frozenset({"Awel", "Awel wachtrij"})
+
+_ROLE_OPERATOR = "operator"
+_ROLE_USER = "user"
+
+
+def _parse_conversation(
+    text: str, conversation_id: str, source: str = "awel_chat", validate: bool = True, keep_raw: bool = False
+) -> ConversationLike:
+    """Parse a single conversation text into a structured Conversation object.
+
+    This function extracts the conversation timestamp, parses individual messages
+    with their timestamps and roles, and creates a structured Conversation object.
+    Messages keep their order in the text. The header only carries the start
+    date, so a message time earlier than the one before it is taken to be on
+    the next day, for chats that run past midnight.
+
+    The expected text format is:
+        Date/time: DD.MM.YYYY, HH:MM - HH:MM
+
+        HH:MM Sender: Message content
+        HH:MM Sender: Message content
+        ...
+
+    Args:
+        text (str): Raw conversation text from the 'gesprek anoniem' column
+        conversation_id (str): Identifier assigned to the conversation
+        source (str, optional): Source identifier for the conversation metadata.
+            Defaults to "awel_chat".
+        validate (bool, optional): Whether to build the models through Pydantic
+            validation. If False, the lightweight ``*Fast`` dataclasses are built
+            instead, trusting the values produced by the regexes. Defaults to True.
+        keep_raw (bool, optional): Whether to store the raw text on the
+            conversation. Defaults to False.
+
+    Returns:
+        ConversationLike: Structured conversation object with parsed messages,
+            metadata, and the given ID; a ConversationFast if validate is False.
+
+    Raises:
+        ValueError: If the conversation timestamp cannot be extracted or
+            if the text format is invalid
+
+    Example:
+        >>> text = "Date/time: 10.02.2023, 17:22 - 17:43\\n\\n17:22 Awel: Hello!"
+        >>> conv = _parse_conversation(text, "awel-0000000")
+        >>> print(f"Conversation ID: {conv.id}")
+        >>> print(f"Messages: {len(conv.messages)}")
+    """
+    # Extract conversation-level timestamp
+    conv_date_match = _DATE_RE.search(text)
+    if not conv_date_match:
+        raise ValueError("Could not find conversation start time")
+
+    conv_date, conv_time = conv_date_match.groups()
+    day, month, year = conv_date.split(".")
+    base = datetime(int(year), int(month), int(day))
+    # replace() raises ValueError on out-of-range times such as 17:75
+    conv_datetime = base.replace(hour=int(conv_time[:2]), minute=int(conv_time[3:5]))
+
+    # Chats often have several messages per minute; datetimes are immutable, so
+    # messages sent in the same minute share one object
+    timestamps = {conv_time: conv_datetime}
+    prev_time = ""
+
+    messages = []
+    # Messages follow the header, so resume scanning where the header ended
+    for match in _MSG_RE.finditer(text, conv_date_match.end()):
+        time_str, role, content = match.groups()
+        # Zero-padded HH:MM strings compare like times; going back means midnight passed
+        if time_str < prev_time:
+            base += timedelta(days=1)
+            timestamps = {}
+        prev_time = time_str
+
+        msg_datetime = timestamps.get(time_str)
+        if msg_datetime is None:
+            msg_datetime = base.replace(hour=int(time_str[:2]), minute=int(time_str[3:5]))
+            timestamps[time_str] = msg_datetime
+
+        role = _ROLE_OPERATOR if role.rstrip() in _OPERATOR_ROLES else _ROLE_USER
+        messages.append((msg_datetime, role, content.strip()))
+
+    # Build Conversation
+    build = _build_conversation if validate else _build_conversation_fast
+    return build(conversation_id, messages, conv_datetime, source, text if keep_raw else None)
+
+
+def _build_conversation(
+    conversation_id: str, messages: list[tuple[datetime, str, str]], timestamp: datetime, source: str, raw: str | None
+) -> Conversation:
+    """Build a validated Conversation from parsed message fields.
+
+    Args:
+        conversation_id (str): Identifier assigned to the conversation
+        messages (list[tuple[datetime, str, str]]): Timestamp, role, and content
+            of each message, in order
+        timestamp (datetime): Start time of the conversation
+        source (str): Source identifier for the conversation metadata
+        raw (str | None): Raw conversation text to keep, if any
+
+    Returns:
+        Conversation: Pydantic model built through validation.
+    """
+    return Conversation(
+        id=conversation_id,
+        topic="Uncategorized",
+        messages=[Message(datetime=ts, role=role, content=content) for ts, role, content in messages],
+        metadata=Metadata(timestamp=timestamp, source=source),
+        raw=raw,
+    )
+
+
+def _build_conversation_fast(
+    conversation_id: str, messages: list[tuple[datetime, str, str]], timestamp: datetime, source: str, raw: str | None
+) -> ConversationFast:
+    """Build an unvalidated ConversationFast from parsed message fields.
+
+    Args:
+        conversation_id (str): Identifier assigned to the conversation
+        messages (list[tuple[datetime, str, str]]): Timestamp, role, and content
+            of each message, in order
+        timestamp (datetime): Start time of the conversation
+        source (str): Source identifier for the conversation metadata
+        raw (str | None): Raw conversation text to keep, if any
+
+    Returns:
+        ConversationFast: Lightweight dataclass, built without validation.
+    """
+    return ConversationFast(
+        id=conversation_id,
+        topic="Uncategorized",
+        messages=[MessageFast(ts, role, content) for ts, role, content in messages],
+        metadata=MetadataFast(timestamp, source),
+        raw=raw,
+    )
 
 
 class AwelReader:
@@ -55,7 +209,12 @@ class AwelReader:
     Attributes:
         data_path (Path): Path to the CSV file containing conversation data
         validate_data (bool): Whether to validate parsed data against Pydantic models
-        _conversations (List[Conversation]): Cached list of parsed conversations
+        keep_raw (bool): Whether parsed conversations keep their raw text
+        _conversations (list[ConversationLike]): Cached list of parsed conversations
+        _table (ConversationTable | None): Columnar summary of the cached conversations
+        _id_index (dict[str, int]): Position of each cached conversation by ID
+        _topics (tuple[str, ...] | None): Cached sorted unique topics
+        _loaded (bool): Whether the CSV file has already been parsed
 
     Example:
         >>> reader = AwelReader("data/conversations.csv")
@@ -65,7 +224,7 @@ class AwelReader:
         >>> stats = reader.get_statistics()
     """
 
-    def __init__(self, data_path: str, validate_data: bool = True):
+    def __init__(self, data_path: str, validate_data: bool = True, keep_raw: bool = False):
         """Initialize the AWEL reader.
 
         Args:
@@ -73,8 +232,14 @@ class AwelReader:
                 Should point to a file like '2023_originalfile_nonicknames.csv'
             validate_data (bool, optional): Whether to validate parsed data against
                 Pydantic models. If True, invalid data will raise exceptions.
-                If False, invalid conversations will be logged and skipped.
+                If False, invalid conversations will be logged and skipped, and
+                the lightweight ConversationFast dataclasses are built instead of
+                Pydantic models for faster loading.
                 Defaults to True.
+            keep_raw (bool, optional): Whether to keep the raw conversation text
+                on each Conversation's ``raw`` field. The text roughly doubles
+                the memory held per conversation, so it is dropped unless
+                requested. Defaults to False.
 
         Raises:
             FileNotFoundError: If the specified data_path does not exist
@@ -85,19 +250,32 @@ class AwelReader:
         """
         self.data_path = Path(data_path)
         self.validate_data = validate_data
-        self._conversations: list[Conversation] = []
+        self.keep_raw = keep_raw
+        self._conversations: list[ConversationLike] = []
+        self._table: ConversationTable | None = None
+        self._id_index: dict[str, int] = {}
+        self._topics: tuple[str, ...] | None = None
+        self._loaded = False
 
         logger.info(f"Initializing AwelReader with data path: {self.data_path}")
 
         if not self.data_path.exists():
             raise FileNotFoundError(f"Data path does not exist: {self.data_path}")
 
-    def load_conversations(self) -> list[Conversation]:
+    def load_conversations(self) -> list[ConversationLike]:
         """Load all conversations from the CSV dataset.
 
         Reads the CSV file and parses each row in the 'gesprek anoniem' column
         into structured Conversation objects. The method caches results, so
-        subsequent calls return the same data without re-parsing.
+        subsequent calls return the same data without re-parsing. Parsed files
+        are also cached process-wide, keyed by path and modification time, so
+        other readers of the same unchanged file reuse the same conversations.
+
+        The returned list is the reader's own, but the conversation objects in it
+        are shared with every other reader of the file and must be treated as
+        read-only. Modifying a conversation (its topic, its messages, ...) would
+        change it for all readers and leave their statistics out of date; copy
+        it first, e.g. with ``model_copy(deep=True)`` or ``dataclasses.replace``.
 
         Returns:
             list[Conversation]: List of parsed Conversation objects, each containing
@@ -107,7 +285,7 @@ class AwelReader:
             ValueError: If the CSV format is invalid or 'gesprek anoniem' column
                 is missing
             FileNotFoundError: If the CSV file specified in data_path doesn't exist
-            pd.errors.EmptyDataError: If the CSV file is empty
+            pa.ArrowInvalid: If the CSV file is empty or malformed
 
         Example:
             >>> reader = AwelReader("data/conversations.csv")
@@ -117,97 +295,96 @@ class AwelReader:
             >>> print(f"First conversation has {len(first_conv.messages)} messages")
         """
 
-        if len(self._conversations) > 0:
+        if self._loaded:
             return self._conversations
 
         logger.info(f"Loading conversations from {self.data_path}")
-        data = pd.read_csv(self.data_path)
-
-        chat_column = data["gesprek anoniem"]
-
-        if type(chat_column) is not pd.Series:
-            raise ValueError("Expected 'gesprek anoniem' column to be a pandas Series")
-
-        self._conversations = self._parse_conversation_list(chat_column)
+        path = self.data_path.resolve()
+        parsed = _load_and_parse_cached(str(path), path.stat().st_mtime_ns, self.validate_data, self.keep_raw)
+        self._conversations = list(parsed)
+        self._id_index = {conv.id: i for i, conv in enumerate(self._conversations)}
+        self._topics = None
+        self._loaded = True
 
         logger.info(f"Loaded {len(self._conversations)} conversations")
         return self._conversations
 
-    def _parse_conversation(self, text: str, source: str = "awel_chat") -> Conversation:
-        """Parse a single conversation text into a structured Conversation object.
-
-        This method extracts the conversation timestamp, parses individual messages
-        with their timestamps and roles, and creates a structured Conversation object.
-
-        The expected text format is:
-            Date/time: DD.MM.YYYY, HH:MM - HH:MM
-
-            HH:MM Sender: Message content
-            HH:MM Sender: Message content
-            ...
+    def iter_conversations(self) -> Iterator[ConversationLike]:
+        """Iterate over the conversations in the CSV dataset without caching them.
 
-        Args:
-            text (str): Raw conversation text from the 'gesprek anoniem' column
-            source (str, optional): Source identifier for the conversation metadata.
-                Defaults to "awel_chat".
+        Reads the CSV file in blocks of ``_CSV_BLOCK_SIZE`` bytes and yields each
+        parsed Conversation as soon as its chunk is processed. Unlike
+        ``load_conversations``, nothing is stored on the reader, so memory use is
+        bounded by the chunk size rather than by the size of the dataset.
 
-        Returns:
-            Conversation: Structured conversation object with parsed messages,
-                metadata, and unique ID.
+        Yields:
+            Conversation: Parsed Conversation objects in file order.
 
         Raises:
-            ValueError: If the conversation timestamp cannot be extracted or
-                if the text format is invalid
+            ValueError: If the 'gesprek anoniem' column is missing
 
         Example:
-            >>> text = "Date/time: 10.02.2023, 17:22 - 17:43\\n\\n17:22 Awel: Hello!"
-            >>> conv = reader._parse_conversation(text)
-            >>> print(f"Conversation ID: {conv.id}")
-            >>> print(f"Messages: {len(conv.messages)}")
+            >>> reader = AwelReader("data/conversations.csv")
+            >>> for conv in reader.iter_conversations():
+            ...     print(f"{conv.id}: {len(conv.messages)} messages")
         """
-        # Extract conversation-level timestamp
-        conv_date_match = re.search(r"Date/time:\s*([\d.]+),\s*(\d{2}:\d{2})", text)
-        if not conv_date_match:
-            raise ValueError("Could not find conversation start time")
-
-        conv_date = conv_date_match.group(1)
-        conv_time = conv_date_match.group(2)
-        conv_datetime = datetime.strptime(f"{conv_date} {conv_time}", "%d.%m.%Y %H:%M")
-
-        # Regex for messages: captures HH:MM, sender, and message
-        msg_pattern = re.compile(r"(\d{2}:\d{2})\s+([^:]+):\s+([^\n]+(?:\n(?!\d{2}:\d{2}).*)*)")
-        messages = []
-        for match in msg_pattern.finditer(text):
-            time_str, role, content = match.groups()
-            msg_datetime = datetime.strptime(f"{conv_date} {time_str}", "%d.%m.%Y %H:%M")
-
-            messages.append(
-                Message(
-                    datetime=msg_datetime,
-                    role="operator" if role.strip() in ["Awel", "Awel wachtrij"] else "user",
-                    content=content.strip(),
-                )
-            )
+        for chunk in self._read_chat_chunks():
+            yield from self._parse_conversation_list(chunk)
+
+    def _read_chat_chunks(self) -> Iterator[pd.Series]:
+        """Read the 'gesprek anoniem' column of the CSV file in chunks.
+
+        The file is streamed with PyArrow's multithreaded CSV reader, one record
+        batch at a time. Only the conversation column is converted, and rows keep
+        their position in the file as index so that log messages and IDs point to
+        the original row.
+
+        Yields:
+            pd.Series: Consecutive slices of the 'gesprek anoniem' column.
 
-        # Build Conversation
-        return Conversation(
-            id=str(uuid.uuid4()),
-            topic="Uncategorized",
-            messages=messages,
-            metadata=Metadata(timestamp=conv_datetime, source=source),
-            raw=text,
+        Raises:
+            ValueError: If the 'gesprek anoniem' column is missing
+        """
+        read_options = pacsv.ReadOptions(block_size=_CSV_BLOCK_SIZE, use_threads=True)
+        # Conversation texts span several lines inside quoted fields
+        parse_options = pacsv.ParseOptions(newlines_in_values=True)
+        convert_options = pacsv.ConvertOptions(
+            include_columns=[_CHAT_COLUMN],
+            column_types={_CHAT_COLUMN: pa.string()},
         )
 
-    def _parse_conversation_list(self, data: pd.Series) -> list[Conversation]:
+        try:
+            reader = pacsv.open_csv(
+                self.data_path,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            )
+        except pa.ArrowKeyError as e:
+            # PyArrow reports a missing include_columns entry as a KeyError
+            raise ValueError(f"Missing '{_CHAT_COLUMN}' column in {self.data_path}") from e
+
+        offset = 0
+        with reader:
+            for batch in reader:
+                chunk = batch.column(0).to_pandas()
+                chunk.index = pd.RangeIndex(offset, offset + batch.num_rows)
+                offset += batch.num_rows
+                yield chunk
+
+    def _parse_conversation_list(self, data: pd.Series) -> list[ConversationLike]:
         """Parse a pandas Series of conversation texts into Conversation objects.
 
         Iterates through each conversation text in the Series and attempts to parse
         it into a structured Conversation object. Failed parses are logged and
         optionally skipped based on the validate_data setting.
 
+        Each conversation gets an ID derived from its CSV row (``awel-0000042``
+        for row 42), so IDs are stable across loads of the same file.
+
         Args:
             data (pd.Series): Series containing raw conversation texts from the
-                'gesprek anoniem' column of the CSV file.
+                'gesprek anoniem' column of the CSV file, indexed by row number.
 
         Returns:
             list[Conversation]: List of successfully parsed Conversation objects.
@@ -224,9 +401,9 @@ class AwelReader:
         """
         conversations = []
 
-        for idx, row in enumerate(data):
+        for idx, row in data.items():
             try:
-                convo = self._parse_conversation(row)
+                convo = _parse_conversation(row, f"awel-{idx:07d}", validate=self.validate_data, keep_raw=self.keep_raw)
                 conversations.append(convo)
 
             except Exception as e:
@@ -236,7 +413,7 @@ class AwelReader:
 
         return conversations
 
-    def filter_by_topic(self, topic: str) -> list[Conversation]:
+    def filter_by_topic(self, topic: str) -> list[ConversationLike]:
         """Filter conversations by topic.
 
         Args:
@@ -251,11 +428,15 @@ class AwelReader:
             >>> print(f"Found {len(anxiety_convs)} anxiety conversations")
         """
         conversations = self.load_conversations()
-        return [conv for conv in conversations if conv.topic == topic]
+        table = self._get_table()
+        return [conversations[i] for i in table.topic_indices(topic)]
 
     def get_topics(self) -> list[str]:
         """Get all unique topics in the dataset.
 
+        The topics are computed once per load and cached; each call returns a
+        fresh list, so callers may modify it.
+
         Returns:
             list[str]: Sorted list of unique topic strings found across all conversations.
 
@@ -265,11 +446,11 @@ class AwelReader:
             >>> print(f"Available topics: {topics}")
             >>> print(f"Found {len(topics)} unique topics")
         """
-        conversations = self.load_conversations()
-        topics = set(conv.topic for conv in conversations)
-        return sorted(list(topics))
+        if self._topics is None:
+            self._topics = tuple(self._get_table().topics.categories)
+        return list(self._topics)
 
-    def get_conversation_by_id(self, conversation_id: str) -> Conversation | None:
+    def get_conversation_by_id(self, conversation_id: str) -> ConversationLike | None:
         """Get a specific conversation by its ID.
 
         Args:
@@ -280,15 +461,13 @@ class AwelReader:
 
         Example:
             >>> reader = AwelReader("data/conversations.csv")
-            >>> conv = reader.get_conversation_by_id("some-uuid-here")
+            >>> conv = reader.get_conversation_by_id("awel-0000042")
             >>> if conv:
             ...     print(f"Found conversation with {len(conv.messages)} messages")
         """
         conversations = self.load_conversations()
-        for conversation in conversations:
-            if conversation.id == conversation_id:
-                return conversation
-        return None
+        idx = self._id_index.get(conversation_id)
+        return None if idx is None else conversations[idx]
 
     def get_statistics(self) -> dict[str, int | float | list[str]]:
         """Get comprehensive statistics about the dataset.
@@ -308,25 +487,19 @@ class AwelReader:
             >>> print(f"Dataset contains {stats['total_conversations']} conversations")
             >>> print(f"Average messages per conversation: {stats['avg_messages_per_conversation']:.1f}")
         """
-        conversations = self.load_conversations()
+        table = self._get_table()
 
-        if not conversations:
+        if not table:
             return {}
 
-        total_conversations = len(conversations)
-        total_messages = sum(len(conv.messages) for conv in conversations)
+        total_conversations = len(table)
+        total_messages = int(table.msg_counts.sum())
         topics = self.get_topics()
 
         # Calculate average conversation duration
-        durations = []
-        for conv in conversations:
-            if len(conv.messages) >= 2:
-                start_time = conv.messages[0].timestamp
-                end_time = conv.messages[-1].timestamp
-                duration_minutes = (end_time - start_time).total_seconds() / 60
-                durations.append(duration_minutes)
-
-        avg_duration = sum(durations) / len(durations) if durations else 0
+        durations = table.durations_minutes()
+
+        avg_duration = float(durations.mean()) if len(durations) else 0
         avg_messages_per_conversation = total_messages / total_conversations
 
         return {
@@ -337,3 +510,38 @@ class AwelReader:
             "topics": topics,
             "avg_conversation_length_minutes": round(avg_duration, 2),
         }
+
+    def _get_table(self) -> ConversationTable:
+        """Return the columnar summary of the dataset, loading it if needed.
+
+        The table is built on first use from the cached conversations.
+
+        Returns:
+            ConversationTable: Table with one row per loaded conversation.
+        """
+        if self._table is None:
+            self._table = ConversationTable.from_conversations(self.load_conversations())
+        return self._table
+
+
+@lru_cache(maxsize=4)
+def _load_and_parse_cached(path: str, mtime_ns: int, validate: bool, keep_raw: bool) -> tuple[ConversationLike, ...]:
+    """Parse an AWEL CSV file once per process and modification time.
+
+    The modification time is part of the cache key, so a file that changes on
+    disk is parsed again. The result is a tuple so that readers sharing a cache
+    entry cannot add or remove conversations from each other's view. The
+    conversations themselves are shared by all those readers and must not be
+    modified. Only arguments that change the parsed result are part of the key.
+
+    Args:
+        path (str): Resolved path of the CSV file
+        mtime_ns (int): Modification time of the file, in nanoseconds
+        validate (bool): Whether to build the models through Pydantic validation
+        keep_raw (bool): Whether parsed conversations keep their raw text
+
+    Returns:
+        tuple[ConversationLike, ...]: Parsed conversations in file order.
+    """
+    reader = AwelReader(path, validate_data=validate, keep_raw=keep_raw)
+    return tuple(reader.iter_conversations())
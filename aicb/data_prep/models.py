@@ -1,5 +1,11 @@
-"""Pydantic models for AICB data structures."""
+"""Pydantic models for AICB data structures.
 
+Each conversation model has a ``*Fast`` counterpart: a slotted, frozen dataclass
+with the same attributes. Readers build those instead when validation is
+turned off, as constructing them is much cheaper than building Pydantic models.
+"""
+
+from dataclasses import dataclass
 from datetime import datetime
 
 from pydantic import BaseModel, Field
@@ -26,10 +32,43 @@ class Conversation(BaseModel):
     id: str = Field(..., description="Unique identifier for the conversation")
     topic: str = Field(..., description="Topic or category of the conversation")
     messages: list[Message] = Field(..., description="List of messages in the conversation")
-    raw: str = Field(..., description="Raw data associated with the conversation")
+    raw: str | None = Field(default=None, description="Raw data associated with the conversation, if kept")
     metadata: Metadata = Field(..., description="Metadata about the conversation")
 
 
+@dataclass(slots=True, frozen=True)
+class MessageFast:
+    """Unvalidated, lightweight counterpart of Message."""
+
+    timestamp: datetime
+    role: str
+    content: str
+
+
+@dataclass(slots=True, frozen=True)
+class MetadataFast:
+    """Unvalidated, lightweight counterpart of Metadata."""
+
+    timestamp: datetime
+    source: str
+
+
+@dataclass(slots=True, frozen=True)
+class ConversationFast:
+    """Unvalidated, lightweight counterpart of Conversation."""
+
+    id: str
+    topic: str
+    messages: list[MessageFast]
+    metadata: MetadataFast
+    raw: str | None = None
+
+
+# Either flavour of a parsed message or conversation; both expose the same attributes
+MessageLike = Message | MessageFast
+ConversationLike = Conversation | ConversationFast
+
+
 class CandidateAnswers(BaseModel):
     """Candidate answers from different models for a conversation."""
 
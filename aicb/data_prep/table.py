@@ -0,0 +1,88 @@
+"""Columnar summary of parsed conversations.
+
+The reader keeps the parsed Conversation models for display, but aggregate
+queries (statistics, topic filters) only need a few scalar values per
+conversation. ConversationTable stores those values as parallel NumPy arrays
+so that these queries run as vectorized passes instead of Python loops over
+the models. The table is held in addition to the models, so it trades a small
+amount of extra memory for faster queries.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .models import ConversationLike
+
+
+@dataclass(frozen=True)
+class ConversationTable:
+    """Struct-of-arrays view over a list of conversations.
+
+    Row ``i`` of every array describes the conversation at position ``i`` of the
+    list the table was built from.
+
+    Attributes:
+        topics (pd.Categorical): Conversation topics
+        msg_counts (np.ndarray): Number of messages per conversation (int32)
+        first_ts (np.ndarray): Timestamp of the first message (datetime64[ns],
+            NaT for conversations without messages)
+        last_ts (np.ndarray): Timestamp of the last message (datetime64[ns],
+            NaT for conversations without messages)
+    """
+
+    topics: pd.Categorical
+    msg_counts: np.ndarray
+    first_ts: np.ndarray
+    last_ts: np.ndarray
+
+    @classmethod
+    def from_conversations(cls, conversations: list[ConversationLike]) -> "ConversationTable":
+        """Build the table from parsed conversations.
+
+        Args:
+            conversations (list[ConversationLike]): Conversations to summarize.
+
+        Returns:
+            ConversationTable: Table with one row per conversation, in order.
+        """
+        n = len(conversations)
+        first = [conv.messages[0].timestamp if conv.messages else None for conv in conversations]
+        last = [conv.messages[-1].timestamp if conv.messages else None for conv in conversations]
+
+        return cls(
+            topics=pd.Categorical([conv.topic for conv in conversations]),
+            msg_counts=np.fromiter((len(conv.messages) for conv in conversations), dtype=np.int32, count=n),
+            first_ts=np.array(first, dtype="datetime64[ns]"),
+            last_ts=np.array(last, dtype="datetime64[ns]"),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of conversations in the table."""
+        return len(self.msg_counts)
+
+    def topic_indices(self, topic: str) -> np.ndarray:
+        """Return the row positions of conversations with the given topic.
+
+        Args:
+            topic (str): Topic string to look up. Must match exactly.
+
+        Returns:
+            np.ndarray: Sorted row positions; empty if the topic is unknown.
+        """
+        if topic not in self.topics.categories:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(self.topics.codes == self.topics.categories.get_loc(topic))
+
+    def durations_minutes(self) -> np.ndarray:
+        """Return conversation durations in minutes.
+
+        Only conversations with at least two messages have a duration; the
+        result has one entry per such conversation.
+
+        Returns:
+            np.ndarray: Durations from first to last message, in minutes (float64).
+        """
+        mask = self.msg_counts >= 2
+        return (self.last_ts[mask] - self.first_ts[mask]) / np.timedelta64(1, "m")
@@ -15,24 +15,143 @@ Usage:
     Run with: streamlit run aicb/interface.py
 """
 
+import html
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 import streamlit as st
 
 # Import the data models and reader
 from aicb.data_prep.awel_reader import AwelReader
-from aicb.data_prep.models import Conversation, Message
+from aicb.data_prep.models import ConversationLike, MessageLike
 
+TITLE = "💬 Chat Data Visualizer"
 
-def load_data() -> tuple[AwelReader, list[Conversation]]:
+FOOTER_HTML = (
+    '<div style="text-align: center; color: #666; font-size: 0.8em;">Chat Data Visualizer | Built with Streamlit</div>'
+)
+
+OPERATOR_TEMPLATE = (
+    '<div style="background-color: #e3f2fd; padding: 10px; border-radius: 10px; margin: 5px 0; '
+    'border-left: 4px solid #2196f3; color: #1a1a1a;">'
+    '<strong style="color: #1565c0;">🎧 Operator</strong> <small style="color: #666;">({time})</small><br>'
+    '<span style="color: #1a1a1a;">{content}</span>'
+    "</div>"
+)
+
+USER_TEMPLATE = (
+    '<div style="background-color: #f3e5f5; padding: 10px; border-radius: 10px; margin: 5px 0; '
+    'border-left: 4px solid #9c27b0; color: #1a1a1a;">'
+    '<strong style="color: #7b1fa2;">👤 User</strong> <small style="color: #666;">({time})</small><br>'
+    '<span style="color: #1a1a1a;">{content}</span>'
+    "</div>"
+)
+
+# Message HTML by role; unknown roles are styled as users
+MESSAGE_TEMPLATES = {"operator": OPERATOR_TEMPLATE, "user": USER_TEMPLATE}
+
+# Largest number of conversations offered in the selection dropdown at once
+MAX_CONVERSATION_OPTIONS = 200
+
+# Entries kept per st.cache_data helper keyed on user input or on a conversation
+CACHE_MAX_ENTRIES = 256
+
+# Default data path - can be modified as needed
+DATA_PATH = "data/2023_originalfile_nonicknames.csv"
+
+
+@st.cache_resource(show_spinner=False)
+def get_reader(path: str) -> AwelReader:
+    """Create an AwelReader for the given path and parse its conversations once.
+
+    Cached with ``st.cache_resource`` so the CSV is parsed once per process
+    instead of on every Streamlit rerun. The reader is shared, not copied, as it
+    holds the parsed conversations and their lookup indices.
+
+    Args:
+        path: Path to the AWEL CSV file
+
+    Returns:
+        AwelReader instance with its conversations loaded
+    """
+    reader = AwelReader(path, validate_data=False)
+    reader.load_conversations()
+    return reader
+
+
+@st.cache_resource(show_spinner=False)
+def get_conversations(path: str) -> list[ConversationLike]:
+    """Return the conversations parsed by the cached reader for the given path.
+
+    Uses ``st.cache_resource`` rather than ``st.cache_data``: the latter would
+    pickle and unpickle the whole dataset on every rerun.
+
+    Args:
+        path: Path to the AWEL CSV file
+
+    Returns:
+        List of parsed conversations
+    """
+    return get_reader(path).load_conversations()
+
+
+@st.cache_resource(show_spinner=False)
+def build_conversation_index(path: str) -> tuple[list[str], dict[str, str], dict[str, ConversationLike]]:
+    """Build the conversation dropdown labels and ID lookup once per dataset.
+
+    Keyed on the data path, so the label formatting runs once per process
+    instead of once per conversation on every rerun. The returned objects
+    are shared between reruns and must not be modified.
+
+    Args:
+        path: Path to the AWEL CSV file
+
+    Returns:
+        tuple: (dropdown labels in display order, conversation ID by label,
+            conversation by ID)
+    """
+    id_by_label = {}
+    conv_by_id = {}
+    for conv in get_conversations(path):
+        # Create a readable label for each conversation
+        start_time = conv.metadata.timestamp.strftime("%d.%m.%Y %H:%M")
+        label = f"{start_time} - {len(conv.messages)} messages - {conv.topic}"
+        id_by_label[label] = conv.id
+        conv_by_id[conv.id] = conv
+
+    return list(id_by_label), id_by_label, conv_by_id
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def filter_conversation_labels(path: str, query: str) -> list[str]:
+    """Return the dropdown labels matching a filter, capped for the browser.
+
+    Rendering every conversation in ``st.selectbox`` stalls the frontend on
+    large datasets, so at most ``MAX_CONVERSATION_OPTIONS`` labels are returned.
+    Cached on the path and query, so unrelated widget changes skip the scan;
+    only the most recent ``CACHE_MAX_ENTRIES`` queries are kept.
+
+    Args:
+        path: Path to the AWEL CSV file
+        query: Case-insensitive substring to look for in the labels
+
+    Returns:
+        Matching labels in display order
+    """
+    labels, _, _ = build_conversation_index(path)
+    query = query.lower()
+    matches = (label for label in labels if query in label.lower())
+    return list(islice(matches, MAX_CONVERSATION_OPTIONS))
+
+
+def load_data() -> tuple[AwelReader, list[ConversationLike]]:
     """Load conversation data using the AwelReader.
 
     Returns:
         tuple: (AwelReader instance, list of conversations)
     """
-    # Default data path - can be modified as needed
-    data_path = "data/2023_originalfile_nonicknames.csv"
+    data_path = DATA_PATH
 
     if not Path(data_path).exists():
         st.error(f"Data file not found: {data_path}")
@@ -40,9 +159,7 @@ def load_data() -> tuple[AwelReader, list[Conversation]]:
         raise FileNotFoundError(f"Data file not found: {data_path}")
 
     try:
-        reader = AwelReader(data_path, validate_data=False)
-        conversations = reader.load_conversations()
-        return reader, conversations
+        return get_reader(data_path), get_conversations(data_path)
     except Exception as e:
         raise RuntimeError(f"Failed to load data: {str(e)}") from e
 
@@ -50,70 +167,44 @@ def load_data() -> tuple[AwelReader, list[Conversation]]:
 def format_message_time(timestamp: datetime) -> str:
     """Format message timestamp for display.
 
+    Equivalent to ``strftime("%H:%M")``, but skips the locale-aware format
+    parsing, which is called once per message on every render.
+
     Args:
         timestamp: Message timestamp
 
     Returns:
-        Formatted time string
+        Formatted time string (HH:MM)
     """
-    return timestamp.strftime("%H:%M")
+    return f"{timestamp.hour:02d}:{timestamp.minute:02d}"
+
 
+def display_message(message: MessageLike) -> str:
+    """Render a single message as an HTML block with appropriate styling.
 
-def display_message(message: Message):
-    """Display a single message with appropriate styling.
+    The caller joins the blocks of all messages and emits them with a single
+    ``st.markdown`` call, so the message must not contain blank lines, which
+    would end the HTML block early.
 
     Args:
-        message: Message object to display
-        is_operator: Whether this is an operator message (for styling)
+        message: Message object to render
+
+    Returns:
+        HTML string for the message
     """
-    is_operator = message.role == "operator"
-
-    # Create columns for message layout
-    if is_operator:
-        col1, col2, col3 = st.columns([1, 6, 1])
-        with col2:
-            st.markdown(
-                f"""
-                <div style="
-                    background-color: #e3f2fd;
-                    padding: 10px;
-                    border-radius: 10px;
-                    margin: 5px 0;
-                    border-left: 4px solid #2196f3;
-                    color: #1a1a1a;
-                ">
-                    <strong style="color: #1565c0;">🎧 Operator</strong> <small style="color: #666;">({format_message_time(message.timestamp)})</small><br>
-                    <span style="color: #1a1a1a;">{message.content}</span>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-    else:
-        col1, col2, col3 = st.columns([1, 6, 1])
-        with col2:
-            st.markdown(
-                f"""
-                <div style="
-                    background-color: #f3e5f5;
-                    padding: 10px;
-                    border-radius: 10px;
-                    margin: 5px 0;
-                    border-left: 4px solid #9c27b0;
-                    color: #1a1a1a;
-                ">
-                    <strong style="color: #7b1fa2;">👤 User</strong> <small style="color: #666;">({format_message_time(message.timestamp)})</small><br>
-                    <span style="color: #1a1a1a;">{message.content}</span>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-
-
-def display_conversation_info(conversation: Conversation):
+    template = MESSAGE_TEMPLATES.get(message.role, USER_TEMPLATE)
+    # Newlines inside the HTML rendered as spaces when each message was its own block
+    content = html.escape(message.content).replace("\n", " ")
+    return template.format(time=format_message_time(message.timestamp), content=content)
+
+
+def display_conversation_info(path: str, conversation: ConversationLike):
     """Display conversation metadata and information.
 
     Args:
-        conversation: Conversation object to display info for
+        path: Path to the AWEL CSV file the conversation was loaded from
+        conversation: Conversation object to display info for, as returned by
+            ``build_conversation_index(path)``
     """
     st.subheader("📋 Conversation Details")
 
@@ -136,24 +227,66 @@ def display_conversation_info(conversation: Conversation):
 
     # Additional details in an expander
     with st.expander("📊 Additional Information"):
-        st.write(f"**Conversation ID:** `{conversation.id}`")
-        st.write(f"**Start Time:** {conversation.metadata.timestamp.strftime('%d.%m.%Y %H:%M')}")
-        st.write(f"**Source:** {conversation.metadata.source}")
+        st.markdown(render_info_block(path, conversation.id))
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def render_info_block(path: str, conversation_id: str) -> str:
+    """Render the "Additional Information" markdown of a conversation once.
 
-        # Message breakdown
-        user_messages = sum(1 for msg in conversation.messages if msg.role == "user")
-        operator_messages = sum(1 for msg in conversation.messages if msg.role == "operator")
-        st.write(f"**User Messages:** {user_messages}")
-        st.write(f"**Operator Messages:** {operator_messages}")
+    Keyed on the data path and conversation ID, which are cheap to hash, so
+    reruns that show the same conversation skip the formatting and counting.
+    Only the ``CACHE_MAX_ENTRIES`` most recently shown conversations are kept.
 
+    Args:
+        path: Path to the AWEL CSV file
+        conversation_id: ID of the conversation to describe
+
+    Returns:
+        Markdown with one paragraph per detail
+    """
+    _, _, conv_by_id = build_conversation_index(path)
+    conversation = conv_by_id[conversation_id]
+
+    # Message breakdown, counted in a single pass
+    user_messages = operator_messages = 0
+    for msg in conversation.messages:
+        user_messages += msg.role == "user"
+        operator_messages += msg.role == "operator"
+
+    lines = [
+        f"**Conversation ID:** `{conversation.id}`",
+        f"**Start Time:** {conversation.metadata.timestamp.strftime('%d.%m.%Y %H:%M')}",
+        f"**Source:** {conversation.metadata.source}",
+        f"**User Messages:** {user_messages}",
+        f"**Operator Messages:** {operator_messages}",
+    ]
+    return "\n\n".join(lines)
+
+
+@st.cache_data(show_spinner=False)
+def cached_statistics(path: str) -> dict[str, int | float | list[str]]:
+    """Compute the dataset statistics once per data path.
+
+    The statistics never change for a loaded dataset, and the result is a
+    small dict, so ``st.cache_data`` copying it on each rerun is cheap.
+
+    Args:
+        path: Path to the AWEL CSV file
 
-def display_dataset_statistics(reader: AwelReader):
+    Returns:
+        Statistics dictionary as returned by ``AwelReader.get_statistics``
+    """
+    return get_reader(path).get_statistics()
+
+
+def display_dataset_statistics(path: str):
     """Display overall dataset statistics.
 
     Args:
-        reader: AwelReader instance with loaded data
+        path: Path to the AWEL CSV file whose statistics are shown
     """
-    stats = reader.get_statistics()
+    stats = cached_statistics(path)
 
     if not stats:
         st.warning("No statistics available")
@@ -173,82 +306,124 @@ def display_dataset_statistics(reader: AwelReader):
         st.write(f"**Available Topics ({len(topics)}):** {', '.join(topics)}")  # type: ignore
 
 
-def main():
-    """Main Streamlit application."""
-    st.set_page_config(page_title="Chat Data Visualizer", page_icon="💬", layout="wide", initial_sidebar_state="expanded")
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def render_conversation_html(path: str, conversation_id: str) -> str:
+    """Render the messages of a conversation into a single HTML block once.
 
-    st.title("💬 Chat Data Visualizer")
-    st.markdown("---")
+    Keyed like ``render_info_block``, so selecting a conversation again reuses
+    the HTML instead of formatting every message on each rerun. Only the
+    ``CACHE_MAX_ENTRIES`` most recently shown conversations are kept, which
+    bounds the memory held by long message threads.
 
-    # Load data
-    with st.spinner("Loading conversation data..."):
-        reader, conversations = load_data()
+    Args:
+        path: Path to the AWEL CSV file
+        conversation_id: ID of the conversation to render
 
-    if not conversations:
-        st.stop()
+    Returns:
+        HTML for all messages, to be emitted with a single ``st.markdown`` call
+    """
+    _, _, conv_by_id = build_conversation_index(path)
 
-    st.success(f"✅ Loaded {len(conversations)} conversations successfully!")
+    # Messages are in chronological order as parsed from the chat text.
+    # The wrapper centers them at the width of the former [1, 6, 1] column layout.
+    parts = ['<div style="max-width: 75%; margin: 0 auto;">']
+    for message in conv_by_id[conversation_id].messages:
+        parts.append(display_message(message))
+    parts.append("</div>")
+    return "".join(parts)
 
-    # Sidebar for dataset statistics
-    with st.sidebar:
-        st.header("📊 Dataset Overview")
-        display_dataset_statistics(reader)
 
-    # Main content area
-    st.header("🔍 Conversation Explorer")
+def render_messages(path: str, conversation: ConversationLike):
+    """Display the messages of a conversation.
 
-    # Create conversation selection dropdown
-    conversation_options = {}
-    for conv in conversations:
-        # Create a readable label for each conversation
-        start_time = conv.metadata.timestamp.strftime("%d.%m.%Y %H:%M")
-        message_count = len(conv.messages)
-        label = f"{start_time} - {message_count} messages - {conv.topic}"
-        conversation_options[label] = conv.id
+    Args:
+        path: Path to the AWEL CSV file the conversation was loaded from
+        conversation: Conversation whose messages are displayed, as returned by
+            ``build_conversation_index(path)``
+    """
+    st.subheader("💬 Conversation Messages")
+
+    if not conversation.messages:
+        st.info("No messages found in this conversation.")
+        return
+
+    st.markdown(render_conversation_html(path, conversation.id), unsafe_allow_html=True)
+
+    # Add some spacing at the bottom
+    st.markdown("<br><br>", unsafe_allow_html=True)
+
+
+@st.fragment
+def conversation_explorer():
+    """Display the conversation filter, dropdown, and the selected conversation.
+
+    Runs as a Streamlit fragment: typing in the filter or picking another
+    conversation reruns only this block instead of the whole page, so the
+    title, sidebar statistics, and footer are not rebuilt.
+    """
+    # Create conversation selection dropdown, narrowed down by a text filter
+    _, id_by_label, conv_by_id = build_conversation_index(DATA_PATH)
+
+    query = st.text_input(
+        "Filter conversations:",
+        help=f"Show conversations whose label contains this text (at most {MAX_CONVERSATION_OPTIONS})",
+    )
+    shown_labels = filter_conversation_labels(DATA_PATH, query)
+
+    if not shown_labels:
+        st.info("No conversations match the filter.")
 
     selected_label = st.selectbox(
         "Select a conversation to view:",
-        options=list(conversation_options.keys()),
+        options=shown_labels,
         help="Choose a conversation from the dropdown to view its messages",
     )
 
     if selected_label:
-        selected_id = conversation_options[selected_label]
-        selected_conversation = reader.get_conversation_by_id(selected_id)
+        selected_id = id_by_label[selected_label]
+        selected_conversation = conv_by_id.get(selected_id)
 
         if selected_conversation:
             # Display conversation information
-            display_conversation_info(selected_conversation)
+            display_conversation_info(DATA_PATH, selected_conversation)
 
             st.markdown("---")
 
             # Display messages
-            st.subheader("💬 Conversation Messages")
+            render_messages(DATA_PATH, selected_conversation)
+        else:
+            st.error("Selected conversation not found.")
 
-            if not selected_conversation.messages:
-                st.info("No messages found in this conversation.")
-            else:
-                # Sort messages by timestamp to ensure chronological order
-                sorted_messages = sorted(selected_conversation.messages, key=lambda x: x.timestamp)
 
-                for message in sorted_messages:
-                    display_message(message)
+def main():
+    """Main Streamlit application."""
+    st.set_page_config(page_title="Chat Data Visualizer", page_icon="💬", layout="wide", initial_sidebar_state="expanded")
 
-                # Add some spacing at the bottom
-                st.markdown("<br><br>", unsafe_allow_html=True)
-        else:
-            st.error("Selected conversation not found.")
+    st.title(TITLE)
+    st.markdown("---")
+
+    # Load data
+    with st.spinner("Loading conversation data..."):
+        _, conversations = load_data()
+
+    if not conversations:
+        st.stop()
+
+    st.success(f"✅ Loaded {len(conversations)} conversations successfully!")
+
+    # Sidebar for dataset statistics
+    with st.sidebar:
+        st.header("📊 Dataset Overview")
+        display_dataset_statistics(DATA_PATH)
+
+    # Main content area
+    st.header("🔍 Conversation Explorer")
+
+    conversation_explorer()
 
     # Footer
     st.markdown("---")
-    st.markdown(
-        """
-        <div style="text-align: center; color: #666; font-size: 0.8em;">
-            Chat Data Visualizer | Built with Streamlit
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,21 @@
 from aicb.data_prep.awel_reader import AwelReader
 
-import pandas as pd
+import pyarrow.csv as pv
 
-data = pd.read_csv("../data/2023_originalfile_nonicknames.csv")
+table = pv.read_csv(
+    "../data/2023_originalfile_nonicknames.csv",
+    parse_options=pv.ParseOptions(newlines_in_values=True),
+    convert_options=pv.ConvertOptions(include_columns=["gesprek anoniem"]),
+)
+data = table.to_pandas()
 
 data.head()["gesprek anoniem"][0]
 
-len(data)
+table.num_rows
 
 cols = data["gesprek anoniem"]
 
-reader = AwelReader("../data/2023_originalfile_nonicknames.csv")
+reader = AwelReader("../data/2023_originalfile_nonicknames.csv", keep_raw=True)
 
 conversations = reader.load_conversations()
 
@@ -0,0 +1,179 @@
+import os
+
+import pandas as pd
+import pytest
+
+from aicb.data_prep import awel_reader
+from aicb.data_prep.awel_reader import AwelReader
+from aicb.data_prep.models import ConversationFast
+
+CONVERSATIONS = [
+    (
+        "Date/time: 10.02.2023, 17:22 - 17:43\n\n"
+        "17:22 Awel wachtrij: Hallo!\n"
+        "17:26 *****: er is al een een week ruzie\nthuis\n"
+        "17:31 Awel: Dag *****, welkom bij awel!"
+    ),
+    "Date/time: 11.02.2023, 09:05 - 09:10\n\n09:05 *****: hoi\n09:10 Awel: Dag!",
+    "not a conversation",
+]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "awel.csv"
+    pd.DataFrame({"id": range(len(CONVERSATIONS)), "gesprek anoniem": CONVERSATIONS}).to_csv(path, index=False)
+    return path
+
+
+def test_load_conversations_parses_messages(csv_path):
+    conversations = AwelReader(str(csv_path)).load_conversations()
+
+    assert len(conversations) == 2
+
+    first = conversations[0]
+    assert [msg.role for msg in first.messages] == ["operator", "user", "operator"]
+    assert first.messages[1].content == "er is al een een week ruzie\nthuis"
+    assert first.messages[2].timestamp.isoformat() == "2023-02-10T17:31:00"
+    assert first.metadata.timestamp.isoformat() == "2023-02-10T17:22:00"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Date/time: 10.02.2023, 29:10 - 29:15\n\n29:10 *****: hoi",
+        "Date/time: 10.02.2023, 17:22 - 17:43\n\n17:75 *****: hoi",
+    ],
+)
+def test_load_conversations_skips_out_of_range_times(tmp_path, text):
+    path = tmp_path / "awel.csv"
+    pd.DataFrame({"gesprek anoniem": [text, CONVERSATIONS[1]]}).to_csv(path, index=False)
+
+    conversations = AwelReader(str(path)).load_conversations()
+
+    assert [conv.id for conv in conversations] == ["awel-0000001"]
+
+
+@pytest.mark.parametrize("validate_data", [True, False])
+def test_load_conversations_past_midnight(tmp_path, validate_data):
+    path = tmp_path / "awel.csv"
+    text = "Date/time: 10.02.2023, 23:50 - 00:10\n\n23:50 Awel: hallo\n23:58 *****: hoi\n00:05 Awel: dag"
+    pd.DataFrame({"gesprek anoniem": [text]}).to_csv(path, index=False)
+    reader = AwelReader(str(path), validate_data=validate_data)
+
+    messages = reader.load_conversations()[0].messages
+
+    assert [msg.content for msg in messages] == ["hallo", "hoi", "dag"]
+    assert messages[-1].timestamp.isoformat() == "2023-02-11T00:05:00"
+    assert reader.get_statistics()["avg_conversation_length_minutes"] == 15.0
+
+
+def test_load_conversations_without_validation(csv_path):
+    validated = AwelReader(str(csv_path)).load_conversations()
+    constructed = AwelReader(str(csv_path), validate_data=False).load_conversations()
+
+    def fields(conv):
+        messages = [(msg.timestamp, msg.role, msg.content) for msg in conv.messages]
+        return conv.id, conv.topic, messages, conv.metadata.timestamp, conv.metadata.source
+
+    assert all(isinstance(conv, ConversationFast) for conv in constructed)
+    assert [fields(conv) for conv in constructed] == [fields(conv) for conv in validated]
+
+
+def test_load_conversations_drops_raw_by_default(csv_path):
+    conversations = AwelReader(str(csv_path)).load_conversations()
+
+    assert all(conv.raw is None for conv in conversations)
+
+
+def test_load_conversations_is_cached(csv_path):
+    reader = AwelReader(str(csv_path))
+
+    assert reader.load_conversations() is reader.load_conversations()
+
+
+def test_iter_conversations_matches_load(csv_path):
+    reader = AwelReader(str(csv_path), keep_raw=True)
+
+    streamed = [conv.raw for conv in reader.iter_conversations()]
+
+    assert streamed == CONVERSATIONS[:2]
+    assert reader._conversations == []
+
+
+def test_get_statistics(csv_path):
+    stats = AwelReader(str(csv_path)).get_statistics()
+
+    assert stats["total_conversations"] == 2
+    assert stats["total_messages"] == 5
+    assert stats["topics"] == ["Uncategorized"]
+    assert stats["avg_conversation_length_minutes"] == 7.0
+
+
+def test_filter_by_topic(csv_path):
+    reader = AwelReader(str(csv_path))
+
+    assert reader.filter_by_topic("Uncategorized") == reader.load_conversations()
+    assert reader.filter_by_topic("anxiety") == []
+
+
+def test_get_conversation_by_id(csv_path):
+    reader = AwelReader(str(csv_path))
+    conversations = reader.load_conversations()
+
+    assert [conv.id for conv in conversations] == ["awel-0000000", "awel-0000001"]
+    assert reader.get_conversation_by_id("awel-0000001") is conversations[1]
+    assert reader.get_conversation_by_id("missing") is None
+
+
+def test_load_conversations_across_blocks(csv_path, monkeypatch):
+    monkeypatch.setattr(awel_reader, "_CSV_BLOCK_SIZE", 256)
+
+    conversations = AwelReader(str(csv_path), keep_raw=True).load_conversations()
+
+    assert [conv.id for conv in conversations] == ["awel-0000000", "awel-0000001"]
+    assert [conv.raw for conv in conversations] == CONVERSATIONS[:2]
+
+
+def test_load_conversations_requires_chat_column(tmp_path):
+    path = tmp_path / "awel.csv"
+    pd.DataFrame({"x": [1]}).to_csv(path, index=False)
+
+    with pytest.raises(ValueError, match="gesprek anoniem"):
+        AwelReader(str(path)).load_conversations()
+
+
+def test_load_conversations_caches_empty_dataset(tmp_path, monkeypatch):
+    path = tmp_path / "empty.csv"
+    pd.DataFrame({"gesprek anoniem": ["not a conversation"]}).to_csv(path, index=False)
+    reader = AwelReader(str(path))
+
+    calls = []
+    read_chat_chunks = AwelReader._read_chat_chunks
+    monkeypatch.setattr(AwelReader, "_read_chat_chunks", lambda self: calls.append(1) or read_chat_chunks(self))
+
+    assert reader.load_conversations() == []
+    assert reader.load_conversations() == []
+    assert len(calls) == 1
+
+
+def test_load_conversations_shared_across_readers(csv_path):
+    first = AwelReader(str(csv_path)).load_conversations()
+    second = AwelReader(str(csv_path)).load_conversations()
+
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+def test_load_conversations_reparses_modified_file(csv_path):
+    first = AwelReader(str(csv_path)).load_conversations()
+
+    pd.DataFrame({"gesprek anoniem": CONVERSATIONS[1:]}).to_csv(csv_path, index=False)
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = AwelReader(str(csv_path)).load_conversations()
+
+    assert len(first) == 2
+    assert [conv.id for conv in second] == ["awel-0000000"]
+    assert second[0].messages[0].content == "hoi"
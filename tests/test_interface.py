@@ -0,0 +1,113 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from aicb import interface
+from aicb.data_prep.models import Message, MessageFast
+from aicb.interface import (
+    OPERATOR_TEMPLATE,
+    USER_TEMPLATE,
+    display_message,
+    filter_conversation_labels,
+    format_message_time,
+    render_conversation_html,
+    render_info_block,
+)
+
+
+@pytest.mark.parametrize(
+    ("timestamp", "expected"),
+    [
+        (datetime(2023, 2, 10, 17, 5), "17:05"),
+        (datetime(2023, 2, 10, 0, 0), "00:00"),
+        (datetime(2023, 2, 10, 9, 30, 59), "09:30"),
+    ],
+)
+def test_format_message_time(timestamp, expected):
+    assert format_message_time(timestamp) == expected
+
+
+@pytest.mark.parametrize(
+    ("role", "template"),
+    [("operator", OPERATOR_TEMPLATE), ("user", USER_TEMPLATE), ("moderator", USER_TEMPLATE)],
+)
+def test_display_message_template_by_role(role, template):
+    message = MessageFast(datetime(2023, 2, 10, 17, 22), role, "Hallo!")
+
+    assert display_message(message) == template.format(time="17:22", content="Hallo!")
+
+
+def test_display_message_escapes_html():
+    message = Message(datetime=datetime(2023, 2, 10, 17, 22), role="user", content='<script>alert("x")</script> & co')
+
+    rendered = display_message(message)
+
+    assert "<script>" not in rendered
+    assert "&lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; &amp; co" in rendered
+
+
+def test_display_message_replaces_newlines():
+    message = MessageFast(datetime(2023, 2, 10, 17, 22), "user", "er is ruzie\n\nthuis")
+
+    rendered = display_message(message)
+
+    assert "\n" not in rendered
+    assert "er is ruzie  thuis" in rendered
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "awel.csv"
+    texts = [
+        f"Date/time: 10.02.2023, 17:{minute:02d} - 17:59\n\n17:{minute:02d} *****: hoi\n17:59 Awel: <b>dag</b>"
+        for minute in range(5)
+    ]
+    pd.DataFrame({"gesprek anoniem": texts}).to_csv(path, index=False)
+    return str(path)
+
+
+def test_filter_conversation_labels_empty_query(csv_path):
+    assert filter_conversation_labels(csv_path, "") == [
+        f"10.02.2023 17:{minute:02d} - 2 messages - Uncategorized" for minute in range(5)
+    ]
+
+
+def test_filter_conversation_labels_ignores_case(csv_path):
+    assert filter_conversation_labels(csv_path, "17:03 - 2 MESSAGES - uncategorized") == [
+        "10.02.2023 17:03 - 2 messages - Uncategorized"
+    ]
+    assert filter_conversation_labels(csv_path, "no match") == []
+
+
+def test_filter_conversation_labels_is_capped(csv_path, monkeypatch):
+    monkeypatch.setattr(interface, "MAX_CONVERSATION_OPTIONS", 3)
+
+    assert filter_conversation_labels(csv_path, "uncategorized") == [
+        f"10.02.2023 17:{minute:02d} - 2 messages - Uncategorized" for minute in range(3)
+    ]
+
+
+def test_render_info_block(csv_path):
+    assert render_info_block(csv_path, "awel-0000003").split("\n\n") == [
+        "**Conversation ID:** `awel-0000003`",
+        "**Start Time:** 10.02.2023 17:03",
+        "**Source:** awel_chat",
+        "**User Messages:** 1",
+        "**Operator Messages:** 1",
+    ]
+
+
+def test_render_conversation_html(csv_path):
+    messages = [
+        MessageFast(datetime(2023, 2, 10, 17, 3), "user", "hoi"),
+        MessageFast(datetime(2023, 2, 10, 17, 59), "operator", "<b>dag</b>"),
+    ]
+
+    rendered = render_conversation_html(csv_path, "awel-0000003")
+
+    assert rendered == (
+        '<div style="max-width: 75%; margin: 0 auto;">' + "".join(display_message(msg) for msg in messages) + "</div>"
+    )
+    assert rendered.count("<div") == 1 + len(messages)
+    assert rendered.index("hoi") < rendered.index("&lt;b&gt;dag&lt;/b&gt;")